@@ -8,7 +8,7 @@ operators.
 
 from json_rules_engine.applier import PatchApplier
 from json_rules_engine.exceptions import PatchError
-from json_rules_engine.patches import Patches
+from json_rules_engine.patches import Patches, get_default_cache_dir
 
 __version__ = "1.0.0"
-__all__ = ["Patches", "PatchApplier", "PatchError"]
+__all__ = ["Patches", "PatchApplier", "PatchError", "get_default_cache_dir"]
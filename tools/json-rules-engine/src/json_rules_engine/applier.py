@@ -2,7 +2,9 @@
 Conditional patch application functionality.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from json_rules_engine.predicates import Predicate, compile_when_clause
 
 
 class PatchApplier:
@@ -14,14 +16,28 @@ class PatchApplier:
     accidental state mutations.
     """
 
-    def __init__(self, patches: List[Dict[str, Any]]) -> None:
+    def __init__(
+        self,
+        patches: List[Dict[str, Any]],
+        predicates: Optional[List[Predicate]] = None,
+    ) -> None:
         """
         Initialize a PatchApplier with patches.
 
         Args:
             patches: List of patch rules.
+            predicates: Optional compiled 'when' clauses, one per patch. If None,
+                they are compiled from the patches.
         """
         self._patches = patches
+        if predicates is None:
+            predicates = [compile_when_clause(patch["when"]) for patch in patches]
+
+        # Pair each predicate with its 'then' clause up front so the apply loop
+        # only unpacks tuples instead of indexing patch dicts per record
+        self._rules: Tuple[Tuple[Predicate, Dict[str, Any]], ...] = tuple(
+            zip(predicates, (patch["then"] for patch in patches))
+        )
 
     def apply_patches(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -35,102 +51,13 @@ class PatchApplier:
         """
         patched_metadata = metadata.copy()
 
-        for patch in self._patches:
-            if self._evaluate_conditions(patch["when"], metadata):
+        for predicate, then_clause in self._rules:
+            if predicate(metadata):
                 # Apply the patch
-                for field_name, field_value in patch["then"].items():
-                    patched_metadata[field_name] = field_value
+                patched_metadata.update(then_clause)
 
         return patched_metadata
 
-    def _evaluate_conditions(
-        self, when_clause: Dict[str, Any], metadata: Dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate if the when clause conditions match the metadata.
-
-        Args:
-            when_clause: The 'when' section of a patch
-            metadata: The metadata to evaluate against
-
-        Returns:
-            True if conditions are met, False otherwise
-        """
-        must_result = True
-        should_result = True
-
-        if "__must__" in when_clause:
-            must_result = self._evaluate_must(when_clause["__must__"], metadata)
-
-        if "__should__" in when_clause:
-            should_result = self._evaluate_should(when_clause["__should__"], metadata)
-
-        # If neither present, patch always applies
-        if "__must__" not in when_clause and "__should__" not in when_clause:
-            return True
-
-        return must_result and should_result
-
-    def _evaluate_must(
-        self, must_clause: List[Dict[str, Any]], metadata: Dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate '__must__' clause with AND logic.
-        All items in the array must evaluate to true.
-
-        Args:
-            must_clause: List of condition items
-            metadata: The metadata to evaluate against
-
-        Returns:
-            True if all conditions match, False otherwise
-        """
-        if not isinstance(must_clause, list):
-            return False
-
-        # Empty array: all() returns True (vacuous truth)
-        return all(self._evaluate_item(item, metadata) for item in must_clause)
-
-    def _evaluate_should(
-        self, should_clause: List[Dict[str, Any]], metadata: Dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate '__should__' clause with OR logic.
-        At least one item in the array must evaluate to true.
-
-        Args:
-            should_clause: List of condition items
-            metadata: The metadata to evaluate against
-
-        Returns:
-            True if any condition matches, False otherwise
-        """
-        if not isinstance(should_clause, list):
-            return False
-
-        # Empty array: any() returns False
-        return any(self._evaluate_item(item, metadata) for item in should_clause)
-
-    def _evaluate_item(self, item: Dict[str, Any], metadata: Dict[str, Any]) -> bool:
-        """
-        Evaluate a single item from a __must__ or __should__ array.
-
-        Args:
-            item: Either a nested structure with __must__/__should__ keys,
-                  or a simple field-value dict
-            metadata: The metadata to evaluate against
-
-        Returns:
-            True if item conditions match, False otherwise
-        """
-        # Check if this is a nested logical structure
-        if "__must__" in item or "__should__" in item:
-            # Recursively evaluate the nested structure
-            return self._evaluate_conditions(item, metadata)
-
-        # Simple field-value dict - all fields must match (implicit AND)
-        return all(metadata.get(k) == v for k, v in item.items())
-
     def get_all_patches(self) -> List[Dict[str, Any]]:
         """
         Get all patches.
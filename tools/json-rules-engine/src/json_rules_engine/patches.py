@@ -2,15 +2,36 @@
 Patch loading and validation functionality.
 """
 
+import hashlib
 import json
+import os
+import pickle
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from json_rules_engine.exceptions import PatchError
+from json_rules_engine.predicates import Predicate, compile_when_clause
 
 if TYPE_CHECKING:
     from json_rules_engine.applier import PatchApplier
 
+# Bump whenever the layout of the cached payload changes
+_PATCH_CACHE_VERSION = 2
+
+
+def get_default_cache_dir() -> Path:
+    """
+    Get the per-user directory for patch caches.
+
+    Uses $XDG_CACHE_HOME when set, falling back to ~/.cache.
+
+    Returns:
+        Path to the json-rules-engine cache directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base_dir / "json-rules-engine"
+
 
 class Patches:
     """
@@ -24,13 +45,39 @@ class Patches:
     def __init__(self) -> None:
         """Initialize an empty Patches repository."""
         self._patches: List[Dict[str, Any]] = []
+        self._predicates: Optional[List[Predicate]] = None
 
-    def load_patch_dir(self, patches_dir: Path) -> None:
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the state for pickling, e.g. when sent to worker processes.
+
+        Compiled predicates are closures that can't be pickled; they are dropped
+        and compiled again on the next get_applier() call.
+
+        Returns:
+            Instance state without compiled predicates
+        """
+        state = self.__dict__.copy()
+        state["_predicates"] = None
+        return state
+
+    def load_patch_dir(
+        self, patches_dir: Path, cache_dir: Optional[Path] = None
+    ) -> None:
         """
         Load all JSON patch files from the specified directory recursively.
 
+        When cache_dir is given, the validated patches are pickled to a cache
+        file in that directory, keyed by the resolved patches directory.
+        Subsequent loads reuse the cache as long as every patch file still has
+        the same path, size and modification time, skipping JSON parsing and
+        validation entirely. Cache files are unpickled, so cache_dir must only
+        be writable by trusted users; get_default_cache_dir() returns a
+        per-user location.
+
         Args:
             patches_dir: Path to directory containing patch JSON files
+            cache_dir: Directory for the patch cache, or None to disable caching
 
         Raises:
             PatchError: If directory doesn't exist or files can't be processed
@@ -50,15 +97,25 @@ class Patches:
         # Sort files for consistent processing order
         json_files.sort()
 
+        if cache_dir is not None:
+            self._load_patch_files_cached(patches_dir, json_files, cache_dir)
+            return
+
         for json_file in json_files:
             self._load_patch_file(json_file)
 
-    def load_patch_file(self, patch_file: Path) -> None:
+    def load_patch_file(
+        self, patch_file: Path, cache_dir: Optional[Path] = None
+    ) -> None:
         """
         Load patches from a single file.
 
+        Caching works as in load_patch_dir(), with the same trust requirement
+        on cache_dir.
+
         Args:
             patch_file: Path to a JSON patch file
+            cache_dir: Directory for the patch cache, or None to disable caching
 
         Raises:
             PatchError: If file doesn't exist or can't be processed
@@ -69,6 +126,10 @@ class Patches:
         if not patch_file.is_file():
             raise PatchError(f"Path is not a file: {patch_file}")
 
+        if cache_dir is not None:
+            self._load_patch_files_cached(patch_file, [patch_file], cache_dir)
+            return
+
         self._load_patch_file(patch_file)
 
     def _load_patch_file(self, patch_file: Path) -> None:
@@ -101,6 +162,126 @@ class Patches:
             patch_with_source["_source_file"] = str(patch_file)
             self._patches.append(patch_with_source)
 
+        # Loaded patches changed - compile them again on the next get_applier()
+        self._predicates = None
+
+    def _load_patch_files_cached(
+        self, source: Path, json_files: List[Path], cache_dir: Path
+    ) -> None:
+        """
+        Load patch files through the on-disk patch cache.
+
+        Args:
+            source: Patches directory or patch file the cache entry belongs to
+            json_files: Sorted list of patch files to load
+            cache_dir: Directory holding the cache files
+
+        Raises:
+            PatchError: If a patch file can't be processed on a cache miss
+        """
+        source_key = hashlib.sha256(str(source.resolve()).encode("utf-8"))
+        cache_file = cache_dir / f"{source_key.hexdigest()}.pkl"
+        signature = self._get_files_signature(json_files)
+
+        cached_patches = self._read_patch_cache(cache_file, signature)
+        if cached_patches is not None:
+            self._patches.extend(cached_patches)
+            self._predicates = None
+            return
+
+        first_new_index = len(self._patches)
+        for json_file in json_files:
+            self._load_patch_file(json_file)
+
+        self._write_patch_cache(cache_file, signature, self._patches[first_new_index:])
+
+    def _get_files_signature(
+        self, json_files: List[Path]
+    ) -> List[Tuple[str, int, int]]:
+        """
+        Build a signature identifying the current state of the patch files.
+
+        Args:
+            json_files: Sorted list of patch files
+
+        Returns:
+            List of (path, mtime in nanoseconds, size) tuples, one per file
+        """
+        signature = []
+        for json_file in json_files:
+            stat_result = json_file.stat()
+            signature.append(
+                (str(json_file), stat_result.st_mtime_ns, stat_result.st_size)
+            )
+        return signature
+
+    def _read_patch_cache(
+        self, cache_file: Path, signature: List[Tuple[str, int, int]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read cached patches if the cache matches the given files signature.
+
+        Args:
+            cache_file: Path to the cache file
+            signature: Signature of the patch files currently on disk
+
+        Returns:
+            List of cached patches, or None if the cache is missing or stale
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                cache_data = pickle.load(f)
+        except Exception:
+            # Missing, unreadable or corrupt cache - fall back to parsing
+            return None
+
+        if (
+            not isinstance(cache_data, dict)
+            or cache_data.get("version") != _PATCH_CACHE_VERSION
+            or cache_data.get("signature") != signature
+        ):
+            return None
+
+        patches = cache_data.get("patches")
+        if not isinstance(patches, list):
+            return None
+
+        return patches
+
+    def _write_patch_cache(
+        self,
+        cache_file: Path,
+        signature: List[Tuple[str, int, int]],
+        patches: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Write patches to the cache file, ignoring failures.
+
+        Args:
+            cache_file: Path to the cache file
+            signature: Signature of the patch files the patches were loaded from
+            patches: Validated patches to cache
+        """
+        cache_data = {
+            "version": _PATCH_CACHE_VERSION,
+            "signature": signature,
+            "patches": patches,
+        }
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            # Keep the cache private - its contents are unpickled on load
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(temp_file, "wb") as f:
+                pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic rename so concurrent loaders never see a partial cache
+            os.replace(temp_file, cache_file)
+        except OSError:
+            # An unwritable cache directory simply means no caching
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
     def _validate_patch_structure(
         self, patch: Dict[str, Any], index: int, file_path: Path
     ) -> None:
@@ -182,7 +363,8 @@ class Patches:
         Create a PatchApplier instance with the loaded patches.
 
         This factory method ensures immutability - each transformation gets its own
-        applier instance with an isolated copy of patches.
+        applier instance with an isolated copy of patches. The 'when' clauses are
+        compiled once and shared by all appliers.
 
         Returns:
             New PatchApplier instance with patches
@@ -190,7 +372,12 @@ class Patches:
         # Import here to avoid circular dependency
         from json_rules_engine.applier import PatchApplier
 
-        return PatchApplier(self._patches.copy())
+        if self._predicates is None:
+            self._predicates = [
+                compile_when_clause(patch["when"]) for patch in self._patches
+            ]
+
+        return PatchApplier(self._patches.copy(), self._predicates.copy())
 
     def get_all_patches(self) -> List[Dict[str, Any]]:
         """
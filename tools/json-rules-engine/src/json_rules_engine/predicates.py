@@ -0,0 +1,144 @@
+"""
+Compilation of 'when' clauses into predicate functions.
+"""
+
+from operator import itemgetter
+from typing import Any, Callable, Dict, List
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+def _always_true(metadata: Dict[str, Any]) -> bool:
+    """Predicate that matches any metadata."""
+    return True
+
+
+def _always_false(metadata: Dict[str, Any]) -> bool:
+    """Predicate that matches no metadata."""
+    return False
+
+
+def compile_when_clause(when_clause: Dict[str, Any]) -> Predicate:
+    """
+    Compile a 'when' clause into a predicate function.
+
+    The clause is walked once at compile time so that evaluating it against
+    a metadata object no longer needs to re-dispatch on the '__must__' and
+    '__should__' keys.
+
+    Args:
+        when_clause: The 'when' section of a patch, or a nested condition
+
+    Returns:
+        Function taking the metadata and returning True if conditions are met
+    """
+    has_must = "__must__" in when_clause
+    has_should = "__should__" in when_clause
+
+    # If neither present, patch always applies
+    if not has_must and not has_should:
+        return _always_true
+
+    if has_must and has_should:
+        must = _compile_must(when_clause["__must__"])
+        should = _compile_should(when_clause["__should__"])
+        return lambda metadata: must(metadata) and should(metadata)
+
+    if has_must:
+        return _compile_must(when_clause["__must__"])
+
+    return _compile_should(when_clause["__should__"])
+
+
+def _compile_must(must_clause: List[Dict[str, Any]]) -> Predicate:
+    """
+    Compile a '__must__' clause with AND logic.
+
+    Args:
+        must_clause: List of condition items
+
+    Returns:
+        Predicate that is True if all items match
+    """
+    if not isinstance(must_clause, list):
+        return _always_false
+
+    predicates = tuple(_compile_item(item) for item in must_clause)
+
+    # Empty array: all() returns True (vacuous truth)
+    if not predicates:
+        return _always_true
+
+    if len(predicates) == 1:
+        return predicates[0]
+
+    return lambda metadata: all(predicate(metadata) for predicate in predicates)
+
+
+def _compile_should(should_clause: List[Dict[str, Any]]) -> Predicate:
+    """
+    Compile a '__should__' clause with OR logic.
+
+    Args:
+        should_clause: List of condition items
+
+    Returns:
+        Predicate that is True if at least one item matches
+    """
+    if not isinstance(should_clause, list):
+        return _always_false
+
+    predicates = tuple(_compile_item(item) for item in should_clause)
+
+    # Empty array: any() returns False
+    if not predicates:
+        return _always_false
+
+    if len(predicates) == 1:
+        return predicates[0]
+
+    return lambda metadata: any(predicate(metadata) for predicate in predicates)
+
+
+def _compile_item(item: Dict[str, Any]) -> Predicate:
+    """
+    Compile a single item from a __must__ or __should__ array.
+
+    Args:
+        item: Either a nested structure with __must__/__should__ keys,
+              or a simple field-value dict
+
+    Returns:
+        Predicate that is True if the item conditions match
+    """
+    # Check if this is a nested logical structure
+    if "__must__" in item or "__should__" in item:
+        return compile_when_clause(item)
+
+    # Single field-value pair is by far the most common condition, so compare
+    # it directly instead of going through a generator expression
+    if len(item) == 1:
+        ((field_name, expected_value),) = item.items()
+        return lambda metadata: metadata.get(field_name) == expected_value
+
+    # Empty dict: all() returns True (vacuous truth)
+    if not item:
+        return _always_true
+
+    # Simple field-value dict - all fields must match (implicit AND). Fetch all
+    # fields with one itemgetter call and compare them as a single tuple.
+    conditions = tuple(item.items())
+    get_values = itemgetter(*item.keys())
+    expected_values = tuple(item.values())
+
+    def predicate(metadata: Dict[str, Any]) -> bool:
+        try:
+            return bool(get_values(metadata) == expected_values)
+        except KeyError:
+            # A missing field reads as None, which may still be the expected value
+            return all(
+                metadata.get(field_name) == expected_value
+                for field_name, expected_value in conditions
+            )
+
+    return predicate
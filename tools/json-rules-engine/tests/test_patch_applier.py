@@ -1,12 +1,15 @@
 """Tests for Patches and PatchApplier classes."""
 
 import json
+import os
+import pickle
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from json_rules_engine import PatchApplier, PatchError, Patches
+from json_rules_engine import PatchApplier, PatchError, Patches, get_default_cache_dir
 
 
 class TestPatches:
@@ -253,6 +256,96 @@ class TestPatches:
             assert isinstance(applier, PatchApplier)
             assert applier.get_loaded_patches_count() == 1
 
+    def test_load_patch_dir_with_cache(self) -> None:
+        """Test loading patches through the on-disk cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir) / "patches"
+            temp_path.mkdir()
+            cache_dir = Path(temp_dir) / "cache"
+            patch_file = temp_path / "test.json"
+            patches_data = [
+                {
+                    "when": {"__must__": [{"field1": "value1"}]},
+                    "then": {"field2": "value2"},
+                }
+            ]
+            with open(patch_file, "w") as f:
+                json.dump(patches_data, f)
+
+            first = Patches()
+            first.load_patch_dir(temp_path, cache_dir=cache_dir)
+            # The cache lives in cache_dir, never next to the patch files
+            assert len(list(cache_dir.glob("*.pkl"))) == 1
+            assert sorted(p.name for p in temp_path.iterdir()) == ["test.json"]
+
+            second = Patches()
+            with patch.object(Patches, "_load_patch_file") as load_patch_file:
+                second.load_patch_dir(temp_path, cache_dir=cache_dir)
+            load_patch_file.assert_not_called()
+            assert second.get_all_patches() == first.get_all_patches()
+
+    def test_load_patch_file_with_cache(self) -> None:
+        """Test loading a single patch file through the on-disk cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "cache"
+            patch_file = Path(temp_dir) / "test.json"
+            with open(patch_file, "w") as f:
+                json.dump([{"when": {}, "then": {"field": "value"}}], f)
+
+            first = Patches()
+            first.load_patch_file(patch_file, cache_dir=cache_dir)
+
+            second = Patches()
+            with patch.object(Patches, "_load_patch_file") as load_patch_file:
+                second.load_patch_file(patch_file, cache_dir=cache_dir)
+            load_patch_file.assert_not_called()
+            assert second.get_all_patches() == first.get_all_patches()
+
+    def test_get_default_cache_dir(self) -> None:
+        """Test that the default cache directory follows XDG_CACHE_HOME."""
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": "/tmp/xdg-cache"}):
+            assert get_default_cache_dir() == Path("/tmp/xdg-cache/json-rules-engine")
+
+    def test_pickle_after_get_applier(self) -> None:
+        """Test that Patches can be pickled once predicates are compiled."""
+        patches = Patches()
+        patches._patches = [
+            {"when": {"__must__": [{"field1": "value1"}]}, "then": {"field2": "v2"}}
+        ]
+        patches.get_applier()
+
+        restored = pickle.loads(pickle.dumps(patches))
+
+        assert restored.get_all_patches() == patches.get_all_patches()
+        result = restored.get_applier().apply_patches({"field1": "value1"})
+        assert result == {"field1": "value1", "field2": "v2"}
+
+    def test_load_patch_dir_with_stale_cache(self) -> None:
+        """Test that a modified patch file invalidates the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir) / "patches"
+            temp_path.mkdir()
+            cache_dir = Path(temp_dir) / "cache"
+            patch_file = temp_path / "test.json"
+            with open(patch_file, "w") as f:
+                json.dump([{"when": {}, "then": {"field": "old"}}], f)
+
+            Patches().load_patch_dir(temp_path, cache_dir=cache_dir)
+
+            with open(patch_file, "w") as f:
+                json.dump(
+                    [
+                        {"when": {}, "then": {"field": "new"}},
+                        {"when": {}, "then": {"other": "new"}},
+                    ],
+                    f,
+                )
+
+            patches = Patches()
+            patches.load_patch_dir(temp_path, cache_dir=cache_dir)
+            assert patches.get_loaded_patches_count() == 2
+            assert patches.get_all_patches()[0]["then"]["field"] == "new"
+
 
 class TestPatchApplier:
     """Test cases for PatchApplier class."""
@@ -592,6 +685,30 @@ class TestPatchApplier:
         result = applier.apply_patches(metadata)
         assert "result" not in result
 
+    def test_null_value_matches_missing_field(self) -> None:
+        """Test that a null condition value matches a missing field."""
+        patches_list = [
+            {
+                "when": {"__must__": [{"field1": None}]},
+                "then": {"result": "single"},
+                "_source_file": "test.json",
+            },
+            {
+                "when": {"__must__": [{"field1": None, "field2": "value2"}]},
+                "then": {"other": "multi"},
+                "_source_file": "test.json",
+            },
+        ]
+        applier = PatchApplier(patches_list)
+
+        result = applier.apply_patches({"field2": "value2"})
+        assert result["result"] == "single"
+        assert result["other"] == "multi"
+
+        result = applier.apply_patches({"field1": "value1", "field2": "value2"})
+        assert "result" not in result
+        assert "other" not in result
+
     def test_empty_arrays(self) -> None:
         """Test behavior with empty arrays."""
         # Empty __must__ array: all() returns True
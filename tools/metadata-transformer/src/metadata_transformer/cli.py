@@ -4,10 +4,10 @@ Command-line interface for the metadata transformer using Click.
 
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 import click
-from json_rules_engine import Patches
+from json_rules_engine import Patches, get_default_cache_dir
 
 from metadata_transformer.exceptions import MetadataTransformerError
 from metadata_transformer.field_mapper import FieldMappings
@@ -47,6 +47,11 @@ from metadata_transformer.value_mapper import ValueMappings
     type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
     help="Single JSON patch file for conditional patching (optional)",
 )
+@click.option(
+    "--patch-cache",
+    is_flag=True,
+    help="Cache validated patches in the user cache directory between runs",
+)
 @click.option(
     "--input-dir",
     type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
@@ -63,6 +68,13 @@ from metadata_transformer.value_mapper import ValueMappings
     required=True,
     help="Directory where transformed files will be written",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes for bulk processing (0 = one per CPU)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 def main(
     field_mapping_file: Path,
@@ -70,9 +82,11 @@ def main(
     target_schema_file: Path,
     patch_dir: Optional[Path],
     patch_file: Optional[Path],
+    patch_cache: bool,
     input_dir: Optional[Path],
     input_file: Optional[Path],
     output_dir: Path,
+    workers: int,
     verbose: bool,
 ) -> None:
     """
@@ -155,12 +169,14 @@ def main(
         except Exception as e:
             click.echo(f"Warning: Error loading schema: {e}", err=True)
 
+        patch_cache_dir = get_default_cache_dir() if patch_cache else None
+
         # Load patches from directory if provided
         if patch_dir:
             if verbose:
                 click.echo(f"Loading patches from directory: {patch_dir}")
             try:
-                patches.load_patch_dir(patch_dir)
+                patches.load_patch_dir(patch_dir, cache_dir=patch_cache_dir)
                 patches_count = patches.get_loaded_patches_count()
                 if verbose:
                     click.echo(f"Loaded {patches_count} patches from directory")
@@ -174,7 +190,7 @@ def main(
             if verbose:
                 click.echo(f"Loading patches from file: {patch_file}")
             try:
-                patches.load_patch_file(patch_file)
+                patches.load_patch_file(patch_file, cache_dir=patch_cache_dir)
                 patches_count = patches.get_loaded_patches_count()
                 if verbose:
                     click.echo(f"Loaded {patches_count} total patches")
@@ -201,7 +217,12 @@ def main(
         elif input_dir:
             # Bulk processing
             _process_bulk_files(
-                transformer, output_generator, input_dir, output_dir, verbose
+                transformer,
+                output_generator,
+                input_dir,
+                output_dir,
+                verbose,
+                workers or None,
             )
 
         click.echo("✅ Metadata transformation completed successfully!")
@@ -248,6 +269,7 @@ def _process_bulk_files(
     input_dir: Path,
     output_dir: Path,
     verbose: bool,
+    workers: Optional[int] = 1,
 ) -> None:
     """Process all JSON files in a directory."""
     json_files = list(input_dir.glob("*.json"))
@@ -261,47 +283,44 @@ def _process_bulk_files(
 
     processed_files: List[Dict[str, Any]] = []
 
-    with click.progressbar(json_files, label="Processing files") as files:
-        for input_file in files:
-            try:
-                # Transform the file
-                result = transformer.transform_metadata_file(input_file)
+    # Transform files (in parallel when workers > 1) in input order
+    results = transformer.transform_many(json_files, workers)
 
-                # Write output
-                output_file = output_generator.write_output_file(
-                    result, input_file, output_dir
-                )
+    with click.progressbar(
+        results, length=len(json_files), label="Processing files"
+    ) as files:
+        for input_file, result, error in files:
+            if error is not None:
+                _record_failed_file(processed_files, input_file, error, verbose)
+                continue
 
-                # Track results
-                metadata_objects = result.get("migrated_metadata", [])
-                object_count = (
-                    len(metadata_objects) if isinstance(metadata_objects, list) else 1
-                )
+            # transform_many sets the result whenever there is no error
+            transformed = cast(Dict[str, Any], result)
 
-                processed_files.append(
-                    {
-                        "input_file": str(input_file),
-                        "output_file": str(output_file),
-                        "status": "success",
-                        "objects_processed": object_count,
-                        "log_entries": len(result.get("processing_log", [])),
-                    }
+            # Write output
+            try:
+                output_file = output_generator.write_output_file(
+                    transformed, input_file, output_dir
                 )
-
             except Exception as e:
-                processed_files.append(
-                    {
-                        "input_file": str(input_file),
-                        "output_file": None,
-                        "status": "failed",
-                        "error": str(e),
-                        "objects_processed": 0,
-                        "log_entries": 0,
-                    }
-                )
+                _record_failed_file(processed_files, input_file, e, verbose)
+                continue
 
-                if verbose:
-                    click.echo(f"❌ Failed to process {input_file.name}: {e}")
+            # Track results
+            metadata_objects = transformed.get("migrated_metadata", [])
+            object_count = (
+                len(metadata_objects) if isinstance(metadata_objects, list) else 1
+            )
+
+            processed_files.append(
+                {
+                    "input_file": str(input_file),
+                    "output_file": str(output_file),
+                    "status": "success",
+                    "objects_processed": object_count,
+                    "log_entries": len(transformed.get("processing_log", [])),
+                }
+            )
 
     # Print summary
     successful = len([f for f in processed_files if f["status"] == "success"])
@@ -315,5 +334,27 @@ def _process_bulk_files(
     click.echo(f"   Total objects transformed: {total_objects}")
 
 
+def _record_failed_file(
+    processed_files: List[Dict[str, Any]],
+    input_file: Path,
+    error: Exception,
+    verbose: bool,
+) -> None:
+    """Record a file that failed during bulk processing."""
+    processed_files.append(
+        {
+            "input_file": str(input_file),
+            "output_file": None,
+            "status": "failed",
+            "error": str(error),
+            "objects_processed": 0,
+            "log_entries": 0,
+        }
+    )
+
+    if verbose:
+        click.echo(f"❌ Failed to process {input_file.name}: {error}")
+
+
 if __name__ == "__main__":
     main()
@@ -4,11 +4,13 @@ Field mapping functionality for transforming legacy field names to target schema
 
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from metadata_transformer.exceptions import FieldMappingError
 from metadata_transformer.processing_log import StructuredProcessingLog
 from metadata_transformer.processing_log_provider import ProcessingLogProvider
+from metadata_transformer.serialization import load_file
 
 
 class FieldMappings:
@@ -46,6 +48,9 @@ class FieldMappings:
         if not json_files:
             raise FieldMappingError(f"No JSON files found in: {field_mapping_dir}")
 
+        # Sort files so the first-loaded mapping wins conflicts deterministically
+        json_files.sort()
+
         for json_file in json_files:
             self._merge_mapping_file(json_file)
 
@@ -71,8 +76,7 @@ class FieldMappings:
             )
 
         try:
-            with open(mapping_file, "r", encoding="utf-8") as f:
-                mapping_data = json.load(f)
+            mapping_data = load_file(mapping_file)
         except json.JSONDecodeError as e:
             raise FieldMappingError(f"Invalid JSON in {mapping_file}: {e}")
         except Exception as e:
@@ -98,8 +102,7 @@ class FieldMappings:
             FieldMappingError: If file can't be read or parsed
         """
         try:
-            with open(mapping_file, "r", encoding="utf-8") as f:
-                mapping_data = json.load(f)
+            mapping_data = load_file(mapping_file)
         except json.JSONDecodeError as e:
             raise FieldMappingError(f"Invalid JSON in {mapping_file}: {e}")
         except Exception as e:
@@ -124,7 +127,8 @@ class FieldMappings:
         Create a FieldMapper instance with the loaded mappings and a log provider.
 
         This factory method ensures immutability - each transformation gets its own
-        mapper instance with an isolated processing log.
+        mapper instance with an isolated processing log. The mappings are shared
+        through a read-only view instead of being copied for every mapper.
 
         Args:
             log_provider: Provider for creating processing logs
@@ -132,7 +136,7 @@ class FieldMappings:
         Returns:
             New FieldMapper instance with mappings and log provider
         """
-        return FieldMapper(self._field_mappings.copy(), log_provider)
+        return FieldMapper(MappingProxyType(self._field_mappings), log_provider)
 
     def get_all_mappings(self) -> Dict[str, Optional[str]]:
         """
@@ -155,7 +159,7 @@ class FieldMapper:
 
     def __init__(
         self,
-        field_mappings: Dict[str, Optional[str]],
+        field_mappings: Mapping[str, Optional[str]],
         log_provider: ProcessingLogProvider,
     ) -> None:
         """
@@ -197,7 +201,7 @@ class FieldMapper:
         Returns:
             Dictionary of all field mappings
         """
-        return self._field_mappings.copy()
+        return dict(self._field_mappings)
 
     def get_processing_log(self) -> StructuredProcessingLog:
         """
@@ -3,6 +3,7 @@ Output generation functionality for writing transformed metadata to files.
 """
 
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -103,6 +104,66 @@ class OutputGenerator:
         lines.append("}")
         return "\n".join(lines)
 
+    def write_bulk_summary(
+        self, processed_files: List[Dict[str, Any]], output_dir: Path
+    ) -> Path:
+        """
+        Write a summary of a bulk processing run.
+
+        The per-file records are written as given, one object per file, since
+        successful and failed records carry different keys.
+
+        Args:
+            processed_files: Per-file records with status and objects_processed
+            output_dir: Directory where the summary file should be written
+
+        Returns:
+            Path to the written summary file
+
+        Raises:
+            FileProcessingError: If summary file can't be written
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        summary_file = output_dir / "bulk_processing_summary.json"
+
+        # Aggregate the totals in a single pass over the records
+        successful_files = 0
+        total_objects = 0
+        for record in processed_files:
+            if record.get("status") == "success":
+                successful_files += 1
+            total_objects += record.get("objects_processed", 0)
+
+        summary_data = {
+            "bulk_processing_summary": {
+                "timestamp": self._get_current_timestamp(),
+                "total_files_processed": len(processed_files),
+                "successful_files": successful_files,
+                "failed_files": len(processed_files) - successful_files,
+                "total_metadata_objects_transformed": total_objects,
+                "output_directory": str(output_dir),
+            },
+            "file_processing_details": processed_files,
+            "processing_log": self.processing_log.copy(),
+        }
+
+        try:
+            with open(summary_file, "w", encoding="utf-8") as f:
+                json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            raise FileProcessingError(f"Error writing summary file {summary_file}: {e}")
+
+        return summary_file
+
+    def _get_current_timestamp(self) -> str:
+        """
+        Get the current UTC time for summary files.
+
+        Returns:
+            Current time as an ISO 8601 string
+        """
+        return datetime.now(timezone.utc).isoformat()
+
     def get_processing_log(self) -> List[str]:
         """
         Get the processing log for output generation operations.
@@ -4,7 +4,8 @@ Structured processing log models for metadata transformation operations.
 
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional
 
 
 @dataclass
@@ -85,6 +86,15 @@ class StructuredProcessingLog:
         """Add a patch that was applied to the metadata (no-op for backwards compatibility)."""
         pass
 
+    def is_empty(self) -> bool:
+        """Check whether nothing has been logged yet."""
+        return not (
+            self.field_mappings
+            or self.ambiguous_mappings
+            or self.value_mappings
+            or self.excluded_data
+        )
+
     def merge_with(self, other: "StructuredProcessingLog") -> None:
         """Merge another log into this one."""
         # Merge field mappings
@@ -98,3 +108,20 @@ class StructuredProcessingLog:
 
         # Merge excluded data
         self.excluded_data.update(other.excluded_data)
+
+    def merge_many(self, others: Iterable["StructuredProcessingLog"]) -> None:
+        """Merge several logs into this one, in order, skipping empty logs."""
+        others = [other for other in others if not other.is_empty()]
+        if not others:
+            return
+
+        # Merge field mappings, value mappings and excluded data
+        for other in others:
+            self.field_mappings.update(other.field_mappings)
+            self.value_mappings.update(other.value_mappings)
+            self.excluded_data.update(other.excluded_data)
+
+        # Merge ambiguous mappings with a single extend
+        self.ambiguous_mappings.extend(
+            chain.from_iterable(other.ambiguous_mappings for other in others)
+        )
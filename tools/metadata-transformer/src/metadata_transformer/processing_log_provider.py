@@ -25,3 +25,30 @@ class ProcessingLogProvider:
             A fresh StructuredProcessingLog instance for tracking transformations
         """
         return StructuredProcessingLog()
+
+
+class SharedProcessingLogProvider(ProcessingLogProvider):
+    """
+    Provider handing out one shared StructuredProcessingLog instance.
+
+    Used to let all phases of a single transformation write into the same log,
+    so their entries don't have to be merged afterwards.
+    """
+
+    def __init__(self, log: StructuredProcessingLog) -> None:
+        """
+        Initialize the provider with the log to share.
+
+        Args:
+            log: The processing log returned by every create_log() call
+        """
+        self._log = log
+
+    def create_log(self) -> StructuredProcessingLog:
+        """
+        Return the shared StructuredProcessingLog instance.
+
+        Returns:
+            The processing log given at construction
+        """
+        return self._log
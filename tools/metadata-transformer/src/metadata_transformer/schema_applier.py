@@ -4,11 +4,13 @@ Schema specification and application functionality for target schema definitions
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from metadata_transformer.exceptions import SchemaValidationError
 from metadata_transformer.processing_log import StructuredProcessingLog
 from metadata_transformer.processing_log_provider import ProcessingLogProvider
+from metadata_transformer.serialization import load_file
 
 
 class Schema:
@@ -24,6 +26,7 @@ class Schema:
         """Initialize an empty Schema repository."""
         self._schema_fields: Dict[str, Dict[str, Any]] = {}
         self._required_fields: List[str] = []
+        self._default_values: Optional[Dict[str, Any]] = None
 
     def load_schema(self, schema_file: Path) -> None:
         """
@@ -41,8 +44,7 @@ class Schema:
         # Schema loading info moved to stdout - handled by CLI
 
         try:
-            with open(schema_file, "r", encoding="utf-8") as f:
-                schema_data = json.load(f)
+            schema_data = load_file(schema_file)
         except json.JSONDecodeError as e:
             raise SchemaValidationError(
                 f"Invalid JSON in schema file {schema_file}: {e}"
@@ -93,14 +95,20 @@ class Schema:
             if field_def.get("required", False):
                 self._required_fields.append(field_name)
 
-    def get_schema_fields(self) -> Dict[str, Dict[str, Any]]:
+        # Loaded fields changed - rebuild defaults on the next get_applier()
+        self._default_values = None
+
+    def get_schema_fields(self) -> Mapping[str, Dict[str, Any]]:
         """
         Get all schema field definitions.
 
+        The schema is not modified after loading, so a read-only view is
+        returned instead of copying the definitions on every call.
+
         Returns:
-            Dictionary of field definitions
+            Read-only mapping of field definitions
         """
-        return self._schema_fields.copy()
+        return MappingProxyType(self._schema_fields)
 
     def get_required_fields(self) -> List[str]:
         """
@@ -177,7 +185,8 @@ class Schema:
         Create a SchemaApplier instance with the loaded schema and a log provider.
 
         This factory method ensures immutability - each transformation gets its own
-        applier instance with an isolated processing log.
+        applier instance with an isolated processing log. The default values of
+        all schema fields are collected once and shared by all appliers.
 
         Args:
             log_provider: Provider for creating processing logs
@@ -185,7 +194,17 @@ class Schema:
         Returns:
             New SchemaApplier instance with schema and log provider
         """
-        return SchemaApplier(self._schema_fields.copy(), log_provider)
+        if self._default_values is None:
+            self._default_values = {
+                field_name: field_def.get("default_value")
+                for field_name, field_def in self._schema_fields.items()
+            }
+
+        return SchemaApplier(
+            MappingProxyType(self._schema_fields),
+            log_provider,
+            MappingProxyType(self._default_values),
+        )
 
 
 class SchemaApplier:
@@ -199,19 +218,29 @@ class SchemaApplier:
 
     def __init__(
         self,
-        schema_fields: Dict[str, Dict[str, Any]],
+        schema_fields: Mapping[str, Dict[str, Any]],
         log_provider: ProcessingLogProvider,
+        default_values: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """
         Initialize a SchemaApplier with schema and log provider.
 
         Args:
-            schema_fields: Dictionary of schema field definitions.
+            schema_fields: Read-only mapping of schema field definitions.
             log_provider: Provider for creating processing logs.
+            default_values: Default value of every schema field, in schema order.
+                Collected from schema_fields if not provided.
         """
         self._schema_fields = schema_fields
         self._log = log_provider.create_log()
 
+        if default_values is None:
+            default_values = {
+                field_name: field_def.get("default_value")
+                for field_name, field_def in schema_fields.items()
+            }
+        self._default_values = default_values
+
     def apply_schema(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apply schema compliance to metadata.
@@ -222,36 +251,23 @@ class SchemaApplier:
         Returns:
             Schema-compliant metadata
         """
-        compliant_metadata = {}
-
-        # Add all schema fields with appropriate values
-        for schema_field in self._schema_fields:
-            if schema_field in metadata:
-                compliant_metadata[schema_field] = metadata[schema_field]
-            else:
-                default_value = self._get_default_value(schema_field)
-                compliant_metadata[schema_field] = default_value
-
-        # Log obsolete fields that don't map to schema
-        for field_name, field_value in metadata.items():
-            if field_name not in self._schema_fields:
-                self._log.add_unmapped_field_with_value(field_name, field_value)
+        # Add all schema fields, using the default value when the field is missing
+        compliant_metadata = {
+            schema_field: metadata[schema_field] if schema_field in metadata else value
+            for schema_field, value in self._default_values.items()
+        }
+
+        # Log obsolete fields that don't map to schema, in metadata order. The
+        # subset check runs in C and skips the scan when every field is known.
+        schema_fields = self._schema_fields
+        if not metadata.keys() <= schema_fields.keys():
+            log_unmapped = self._log.add_unmapped_field_with_value
+            for field_name, field_value in metadata.items():
+                if field_name not in schema_fields:
+                    log_unmapped(field_name, field_value)
 
         return compliant_metadata
 
-    def _get_default_value(self, field_name: str) -> Any:
-        """
-        Get the default value for a schema field.
-
-        Args:
-            field_name: Name of the field
-
-        Returns:
-            Default value for the field, or None if no default specified
-        """
-        field_def = self._schema_fields.get(field_name, {})
-        return field_def.get("default_value")
-
     def get_processing_log(self) -> StructuredProcessingLog:
         """
         Get the processing log for schema compliance operations.
@@ -261,11 +277,11 @@ class SchemaApplier:
         """
         return self._log
 
-    def get_schema_fields(self) -> Dict[str, Dict[str, Any]]:
+    def get_schema_fields(self) -> Mapping[str, Dict[str, Any]]:
         """
         Get all schema field definitions.
 
         Returns:
-            Dictionary of field definitions
+            Read-only mapping of field definitions
         """
-        return self._schema_fields.copy()
+        return self._schema_fields
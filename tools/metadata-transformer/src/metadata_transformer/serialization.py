@@ -0,0 +1,58 @@
+"""
+JSON decoding helpers with optional orjson acceleration.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+
+    orjson rejects some documents the standard library accepts (e.g. NaN and
+    Infinity literals), so on a decode error the data is parsed again with the
+    json module to keep the original behavior.
+
+    Args:
+        data: Raw UTF-8 encoded JSON document
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """
+    Read and decode a JSON file.
+
+    The file is read as bytes so the decoder parses UTF-8 directly instead of
+    going through an intermediate str.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        OSError: If the file can't be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return loads(path.read_bytes())
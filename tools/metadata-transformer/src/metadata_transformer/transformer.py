@@ -3,19 +3,31 @@ Core metadata transformation logic implementing the 4-phase transformation proce
 """
 
 import json
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from json_rules_engine import Patches
-from pyjsonpatch import generate_patch
+from pyjsonpatch import escape_json_ptr, generate_patch
 
 from metadata_transformer.exceptions import FileProcessingError
 from metadata_transformer.field_mapper import FieldMappings
 from metadata_transformer.processing_log import StructuredProcessingLog
-from metadata_transformer.processing_log_provider import ProcessingLogProvider
+from metadata_transformer.processing_log_provider import (
+    ProcessingLogProvider,
+    SharedProcessingLogProvider,
+)
 from metadata_transformer.schema_applier import Schema
+from metadata_transformer.serialization import load_file
 from metadata_transformer.value_mapper import ValueMappings
 
+# Outcome of transforming one file: (input file, output or None, error or None)
+TransformResult = Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]
+
+# Transformer used by the current worker process of transform_many()
+_worker_transformer: Optional["MetadataTransformer"] = None
+
 
 class MetadataTransformer:
     """Core metadata transformation engine."""
@@ -78,11 +90,12 @@ class MetadataTransformer:
 
         # File processing completion info moved to stdout - handled by CLI
 
-        # Build output result using original data as base
-        output = loaded_object.copy()
+        # Build output result using original data as base. The loaded object is
+        # private to this call, so it is extended in place instead of copied.
+        output = loaded_object
 
         # Sort JSON patches for consistency
-        json_patches = generate_patch(legacy_metadata, transformed_metadata)
+        json_patches = self._generate_patch(legacy_metadata, transformed_metadata)
         sorted_json_patches = self._sort_patches(json_patches)
 
         output["modified_metadata"] = transformed_metadata
@@ -91,6 +104,46 @@ class MetadataTransformer:
 
         return output
 
+    def transform_many(
+        self,
+        input_files: Iterable[Path],
+        workers: Optional[int] = None,
+        chunksize: int = 16,
+    ) -> Iterator[TransformResult]:
+        """
+        Transform several legacy metadata files, optionally in parallel.
+
+        Files are independent of each other, so with more than one worker they are
+        distributed over a process pool. Each worker receives this transformer
+        once at startup and files are sent in chunks to amortize IPC overhead.
+        A failing file does not stop the batch; its error is yielded instead.
+
+        Args:
+            input_files: Paths to the legacy metadata JSON files
+            workers: Number of worker processes. 1 transforms the files in this
+                process; None uses one worker per CPU.
+            chunksize: Number of files sent to a worker at a time
+
+        Returns:
+            Iterator of (input file, output, error) tuples in input order, where
+            exactly one of output and error is None
+        """
+        input_files = list(input_files)
+
+        if workers == 1 or len(input_files) <= 1:
+            for input_file in input_files:
+                yield _transform_file(self, input_file)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            yield from executor.map(
+                _transform_in_worker, input_files, chunksize=chunksize
+            )
+
     def _load_metadata(self, input_file: Path) -> Dict[str, Any]:
         """
         Load metadata from JSON file.
@@ -104,12 +157,10 @@ class MetadataTransformer:
         Raises:
             FileProcessingError: If file can't be loaded or is invalid
         """
-        if not input_file.exists():
-            raise FileProcessingError(f"Input file not found: {input_file}")
-
         try:
-            with open(input_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_file(input_file)
+        except FileNotFoundError:
+            raise FileProcessingError(f"Input file not found: {input_file}")
         except json.JSONDecodeError as e:
             raise FileProcessingError(f"Invalid JSON in {input_file}: {e}")
         except Exception as e:
@@ -130,7 +181,8 @@ class MetadataTransformer:
         Transform metadata through the 4-phase process.
 
         Phases are executed conditionally based on which dependencies are available.
-        If a dependency is None, the corresponding phase is skipped.
+        If a dependency is None, the corresponding phase is skipped. All phases
+        write into one processing log shared for this transformation.
 
         Args:
             legacy_metadata: Legacy metadata dictionary
@@ -139,6 +191,8 @@ class MetadataTransformer:
             Tuple of (transformed metadata dictionary, combined processing log)
         """
         combined_log = StructuredProcessingLog()
+        log_provider = SharedProcessingLogProvider(combined_log)
+        phase_logs: List[StructuredProcessingLog] = []
         current_metadata = legacy_metadata
 
         # Phase 0: Conditional Patching (if patches available)
@@ -146,33 +200,36 @@ class MetadataTransformer:
             patched_metadata, patch_applier_log = self._phase0_conditional_patching(
                 current_metadata
             )
-            combined_log.merge_with(patch_applier_log)
+            phase_logs.append(patch_applier_log)
             current_metadata = patched_metadata
 
         # Phase 1: Field Mapping (if field mappings available)
         if self.field_mappings is not None:
             field_mapped_metadata, field_mapping_log = self._phase1_field_mapping(
-                current_metadata
+                current_metadata, log_provider
             )
-            combined_log.merge_with(field_mapping_log)
+            phase_logs.append(field_mapping_log)
             current_metadata = field_mapped_metadata
 
         # Phase 2: Value Mapping (if value mappings available)
         if self.value_mappings is not None:
             value_mapped_metadata, value_mapping_log = self._phase2_value_mapping(
-                current_metadata
+                current_metadata, log_provider
             )
-            combined_log.merge_with(value_mapping_log)
+            phase_logs.append(value_mapping_log)
             current_metadata = value_mapped_metadata
 
         # Phase 3: Schema Compliance (if schema available)
         if self.schema is not None:
             schema_compliant_metadata, schema_compliance_log = (
-                self._phase3_schema_compliance(current_metadata)
+                self._phase3_schema_compliance(current_metadata, log_provider)
             )
-            combined_log.merge_with(schema_compliance_log)
+            phase_logs.append(schema_compliance_log)
             current_metadata = schema_compliant_metadata
 
+        # Phases normally log into combined_log directly; merge any separate logs
+        combined_log.merge_many(log for log in phase_logs if log is not combined_log)
+
         return current_metadata, combined_log
 
     def _phase0_conditional_patching(
@@ -195,23 +252,31 @@ class MetadataTransformer:
         return patched_metadata, StructuredProcessingLog()
 
     def _phase1_field_mapping(
-        self, metadata: Dict[str, Any]
+        self,
+        metadata: Dict[str, Any],
+        log_provider: Optional[ProcessingLogProvider] = None,
     ) -> Tuple[Dict[str, Any], StructuredProcessingLog]:
         """
         Phase 1: Apply field name mappings to transform legacy field names.
 
         Args:
             metadata: Legacy metadata dictionary
+            log_provider: Provider for the phase log, defaults to the transformer's
 
         Returns:
             Metadata with mapped field names and the processing log
         """
-        field_mapper = self.field_mappings.get_mapper(self.log_provider)
+        if log_provider is None:
+            log_provider = self.log_provider
+
+        field_mapper = self.field_mappings.get_mapper(log_provider)
+        map_field = field_mapper.map_field
+        log_field_mapping = field_mapper.log_field_mapping
 
         mapped_metadata: Dict[str, Any] = {}
 
         for legacy_field, value in metadata.items():
-            target_field = field_mapper.map_field(legacy_field)
+            target_field = map_field(legacy_field)
 
             if target_field is not None:
                 if target_field in mapped_metadata:
@@ -222,7 +287,7 @@ class MetadataTransformer:
                     if (
                         legacy_field != target_field
                     ):  # Only log when legacy_field maps to a different field
-                        field_mapper.log_field_mapping(legacy_field, target_field)
+                        log_field_mapping(legacy_field, target_field)
             else:
                 # No mapping found - keep original field name
                 mapped_metadata[legacy_field] = value
@@ -230,51 +295,123 @@ class MetadataTransformer:
         return mapped_metadata, field_mapper.get_processing_log()
 
     def _phase2_value_mapping(
-        self, metadata: Dict[str, Any]
+        self,
+        metadata: Dict[str, Any],
+        log_provider: Optional[ProcessingLogProvider] = None,
     ) -> Tuple[Dict[str, Any], StructuredProcessingLog]:
         """
         Phase 2: Apply value mappings to transform field values.
 
         Args:
             metadata: Metadata with field names already mapped
+            log_provider: Provider for the phase log, defaults to the transformer's
 
         Returns:
             Metadata with mapped values and the processing log
         """
-        value_mapper = self.value_mappings.get_mapper(self.log_provider)
+        if log_provider is None:
+            log_provider = self.log_provider
 
-        value_mapped_metadata = {}
+        value_mapper = self.value_mappings.get_mapper(log_provider)
+        map_value = value_mapper.map_value
+        mapped_fields = value_mapper.get_mapped_fields()
 
-        for field_name, value in metadata.items():
-            mapped_value = value_mapper.map_value(field_name, value)
-            value_mapped_metadata[field_name] = mapped_value
+        # Only fields with value mappings can change - pass the rest through
+        value_mapped_metadata = {
+            field_name: (
+                map_value(field_name, value) if field_name in mapped_fields else value
+            )
+            for field_name, value in metadata.items()
+        }
 
         return value_mapped_metadata, value_mapper.get_processing_log()
 
     def _phase3_schema_compliance(
-        self, metadata: Dict[str, Any]
+        self,
+        metadata: Dict[str, Any],
+        log_provider: Optional[ProcessingLogProvider] = None,
     ) -> Tuple[Dict[str, Any], StructuredProcessingLog]:
         """
         Phase 3: Ensure metadata complies with target schema.
 
         Args:
             metadata: Metadata with field and value mappings applied
+            log_provider: Provider for the phase log, defaults to the transformer's
 
         Returns:
             Schema-compliant metadata and the processing log
         """
-        schema_applier = self.schema.get_applier(self.log_provider)
+        if log_provider is None:
+            log_provider = self.log_provider
+
+        schema_applier = self.schema.get_applier(log_provider)
 
         compliant_metadata = schema_applier.apply_schema(metadata)
 
         return compliant_metadata, schema_applier.get_processing_log()
 
+    def _generate_patch(
+        self, source: Dict[str, Any], target: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate JSON Patch operations transforming source metadata into target.
+
+        The transformation phases only add, remove or replace top-level fields, so
+        fields are compared directly and the recursive diff is only used for
+        changed fields holding an object or array on both sides. The operations
+        are the same as those produced by pyjsonpatch.generate_patch.
+
+        Args:
+            source: Legacy metadata dictionary
+            target: Transformed metadata dictionary
+
+        Returns:
+            List of JSON Patch operations
+        """
+        if not isinstance(source, dict) or not isinstance(target, dict):
+            return generate_patch(source, target)
+
+        patches: List[Dict[str, Any]] = []
+
+        for field_name, source_value in source.items():
+            path = f"/{escape_json_ptr(field_name)}"
+            if field_name not in target:
+                patches.append({"op": "remove", "path": path})
+                continue
+
+            target_value = target[field_name]
+            if source_value is target_value or source_value == target_value:
+                continue
+
+            if (isinstance(source_value, dict) and isinstance(target_value, dict)) or (
+                isinstance(source_value, list) and isinstance(target_value, list)
+            ):
+                generate_patch(source_value, target_value, path, patches)
+            else:
+                patches.append({"op": "replace", "path": path, "value": target_value})
+
+        for field_name, target_value in target.items():
+            if field_name not in source:
+                if isinstance(target_value, (dict, list)):
+                    target_value = deepcopy(target_value)
+                patches.append(
+                    {
+                        "op": "add",
+                        "path": f"/{escape_json_ptr(field_name)}",
+                        "value": target_value,
+                    }
+                )
+
+        return patches
+
     def _sort_patches(self, patches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Sort JSON Patch operations for consistency.
 
-        Sorts by operation type, path, from field (for move ops), and full JSON.
-        This ensures deterministic ordering for the patch operations.
+        Sorts by operation type, path and from field (for move ops). A diff never
+        holds two operations of the same type on the same path, and the sort is
+        stable, so this ensures deterministic ordering for the patch operations
+        without serializing each operation as a tiebreaker.
 
         Args:
             patches: List of JSON Patch operations
@@ -288,6 +425,49 @@ class MetadataTransformer:
                 x.get("op", ""),
                 x.get("path", ""),
                 x.get("from", ""),  # Include 'from' field for move operations
-                json.dumps(x, sort_keys=True),
             ),
         )
+
+
+def _transform_file(
+    transformer: MetadataTransformer, input_file: Path
+) -> TransformResult:
+    """
+    Transform a single file, capturing any error instead of raising it.
+
+    Args:
+        transformer: Transformer to use
+        input_file: Path to the legacy metadata JSON file
+
+    Returns:
+        Tuple of (input file, output or None, error or None)
+    """
+    try:
+        return input_file, transformer.transform_metadata_file(input_file), None
+    except Exception as e:
+        return input_file, None, e
+
+
+def _init_worker(transformer: MetadataTransformer) -> None:
+    """
+    Store the transformer for the current worker process.
+
+    Args:
+        transformer: Transformer shared by all files handled by this worker
+    """
+    global _worker_transformer
+    _worker_transformer = transformer
+
+
+def _transform_in_worker(input_file: Path) -> TransformResult:
+    """
+    Transform a single file with the transformer of the current worker process.
+
+    Args:
+        input_file: Path to the legacy metadata JSON file
+
+    Returns:
+        Tuple of (input file, output or None, error or None)
+    """
+    assert _worker_transformer is not None
+    return _transform_file(_worker_transformer, input_file)
@@ -4,11 +4,19 @@ Value mapping functionality for transforming legacy field values to target schem
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Tuple
 
 from metadata_transformer.exceptions import ValueMappingError
 from metadata_transformer.processing_log import StructuredProcessingLog
 from metadata_transformer.processing_log_provider import ProcessingLogProvider
+from metadata_transformer.serialization import load_file
+
+# Per-field lookup tables: (unambiguous value -> target, ambiguous value -> options)
+ValueLookupTables = Tuple[Dict[str, Dict[Any, Any]], Dict[str, Dict[Any, List[Any]]]]
+
+# Marker for a missing lookup result, since None is a valid target value
+_MISSING = object()
 
 
 class ValueMappings:
@@ -23,6 +31,9 @@ class ValueMappings:
     def __init__(self) -> None:
         """Initialize an empty ValueMappings repository."""
         self._value_mappings: Dict[str, Dict[str, Any]] = {}
+        # Snapshot of the mappings and lookup tables shared by mappers
+        self._mappings_snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lookup_tables: Optional[ValueLookupTables] = None
 
     def load_value_mappings(self, value_mapping_dir: Path) -> None:
         """
@@ -60,8 +71,7 @@ class ValueMappings:
             ValueMappingError: If file can't be read or parsed
         """
         try:
-            with open(mapping_file, "r", encoding="utf-8") as f:
-                mapping_data = json.load(f)
+            mapping_data = load_file(mapping_file)
         except json.JSONDecodeError as e:
             raise ValueMappingError(f"Invalid JSON in {mapping_file}: {e}")
         except Exception as e:
@@ -85,12 +95,19 @@ class ValueMappings:
                     self._value_mappings[field_name] = {}
                 self._value_mappings[field_name][key] = value
 
+        # Loaded mappings changed - take a new snapshot on the next get_mapper()
+        self._mappings_snapshot = None
+        self._lookup_tables = None
+
     def get_mapper(self, log_provider: ProcessingLogProvider) -> "ValueMapper":
         """
         Create a ValueMapper instance with the loaded mappings and a log provider.
 
         This factory method ensures immutability - each transformation gets its own
-        mapper instance with an isolated processing log.
+        mapper instance with an isolated processing log. A snapshot of the
+        mappings and the lookup tables built from it are taken once and shared
+        by all mappers through a read-only view, so existing mappers keep a
+        consistent view when more mappings are loaded later.
 
         Args:
             log_provider: Provider for creating processing logs
@@ -98,7 +115,16 @@ class ValueMappings:
         Returns:
             New ValueMapper instance with mappings and log provider
         """
-        return ValueMapper(self._value_mappings.copy(), log_provider)
+        if self._mappings_snapshot is None or self._lookup_tables is None:
+            self._mappings_snapshot = {
+                field_name: dict(field_mappings)
+                for field_name, field_mappings in self._value_mappings.items()
+            }
+            self._lookup_tables = build_lookup_tables(self._mappings_snapshot)
+
+        return ValueMapper(
+            MappingProxyType(self._mappings_snapshot), log_provider, self._lookup_tables
+        )
 
     def get_all_mappings(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -121,8 +147,9 @@ class ValueMapper:
 
     def __init__(
         self,
-        value_mappings: Dict[str, Dict[str, Any]],
+        value_mappings: Mapping[str, Dict[str, Any]],
         log_provider: ProcessingLogProvider,
+        lookup_tables: Optional[ValueLookupTables] = None,
     ) -> None:
         """
         Initialize a ValueMapper with mappings and log provider.
@@ -130,10 +157,16 @@ class ValueMapper:
         Args:
             value_mappings: Dictionary of field -> value mappings.
             log_provider: Provider for creating processing logs.
+            lookup_tables: Lookup tables built from value_mappings by
+                build_lookup_tables(). Built from value_mappings if not provided.
         """
         self._value_mappings = value_mappings
         self._log = log_provider.create_log()
 
+        if lookup_tables is None:
+            lookup_tables = build_lookup_tables(value_mappings)
+        self._target_values, self._ambiguous_values = lookup_tables
+
     def map_value(self, field_name: str, legacy_value: Any) -> Any:
         """
         Map a legacy field value to its target schema equivalent.
@@ -145,32 +178,28 @@ class ValueMapper:
         Returns:
             The mapped value, or the original value if no mapping exists
         """
-        if field_name not in self._value_mappings:
+        target_values = self._target_values.get(field_name)
+        if target_values is None:
             return legacy_value
 
-        value_mapping = self._value_mappings[field_name]
-
         # Convert value to string for lookup if it's not already
-        lookup_key = str(legacy_value) if legacy_value is not None else None
-
-        if lookup_key in value_mapping:
-            mapped_value = value_mapping[lookup_key]
-
-            # Check if mapped_value is a list with multiple options
-            if isinstance(mapped_value, list) and len(mapped_value) > 1:
-                # Don't replace the value, keep original and log need for manual selection
-                self._log.add_unmapped_value(field_name, legacy_value, mapped_value)
-                return legacy_value
-            else:
-                # Single value or single-item list - proceed with replacement
-                # If it's a single-item list, extract the single value
-                if isinstance(mapped_value, list) and len(mapped_value) == 1:
-                    mapped_value = mapped_value[0]
-
-                # Add to structured log
-                self._log.add_mapped_value(legacy_value, mapped_value, field_name)
-
-                return mapped_value
+        if type(legacy_value) is str:
+            lookup_key = legacy_value
+        elif legacy_value is None:
+            lookup_key = None
+        else:
+            lookup_key = str(legacy_value)
+
+        # Single value or single-item list - proceed with replacement
+        mapped_value = target_values.get(lookup_key, _MISSING)
+        if mapped_value is not _MISSING:
+            self._log.add_mapped_value(legacy_value, mapped_value, field_name)
+            return mapped_value
+
+        # Multiple options - keep original and log need for manual selection
+        options = self._ambiguous_values[field_name].get(lookup_key)
+        if options is not None:
+            self._log.add_unmapped_value(field_name, legacy_value, options)
 
         return legacy_value
 
@@ -186,6 +215,18 @@ class ValueMapper:
         """
         return field_name in self._value_mappings
 
+    def get_mapped_fields(self) -> AbstractSet[str]:
+        """
+        Get the names of all fields that have value mappings.
+
+        Values of any other field are returned unchanged by map_value, so callers
+        can use this to skip the call for them.
+
+        Returns:
+            Read-only set-like view of field names with value mappings
+        """
+        return self._value_mappings.keys()
+
     def get_field_mappings(self, field_name: str) -> Dict[str, Any]:
         """
         Get all value mappings for a specific field.
@@ -205,7 +246,7 @@ class ValueMapper:
         Returns:
             Dictionary of all value mappings organized by field name
         """
-        return self._value_mappings.copy()
+        return dict(self._value_mappings)
 
     def get_processing_log(self) -> StructuredProcessingLog:
         """
@@ -215,3 +256,40 @@ class ValueMapper:
             StructuredProcessingLog object
         """
         return self._log
+
+
+def build_lookup_tables(
+    value_mappings: Mapping[str, Dict[str, Any]],
+) -> ValueLookupTables:
+    """
+    Split value mappings into per-field lookup tables used by ValueMapper.
+
+    Single-item lists are unwrapped up front, and mappings to several options
+    are kept apart, so mapping a value takes a single dictionary lookup.
+
+    Args:
+        value_mappings: Dictionary of field -> value mappings
+
+    Returns:
+        Tuple of (field -> value -> target value, field -> value -> list of
+        target options) dictionaries, both holding every field
+    """
+    target_values: Dict[str, Dict[Any, Any]] = {}
+    ambiguous_values: Dict[str, Dict[Any, List[Any]]] = {}
+
+    for field_name, value_mapping in value_mappings.items():
+        field_targets: Dict[Any, Any] = {}
+        field_options: Dict[Any, List[Any]] = {}
+
+        for legacy_value, mapped_value in value_mapping.items():
+            if isinstance(mapped_value, list) and len(mapped_value) > 1:
+                field_options[legacy_value] = mapped_value
+            elif isinstance(mapped_value, list) and len(mapped_value) == 1:
+                field_targets[legacy_value] = mapped_value[0]
+            else:
+                field_targets[legacy_value] = mapped_value
+
+        target_values[field_name] = field_targets
+        ambiguous_values[field_name] = field_options
+
+    return target_values, ambiguous_values
@@ -256,6 +256,120 @@ class TestCLI:
                 output_file = output_dir / f"file{i}.json"
                 assert output_file.exists()
 
+    def test_cli_bulk_processing_parallel(self) -> None:
+        """Test bulk processing with several worker processes."""
+        with TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            field_mapping_file = temp_path / "mapping.json"
+            field_mapping_file.write_text('{"legacy": "target"}')
+
+            value_mapping_dir = temp_path / "value_mappings"
+            value_mapping_dir.mkdir()
+            (value_mapping_dir / "values.json").write_text('{"target": {"old": "new"}}')
+
+            schema_file = temp_path / "schema.json"
+            schema_file.write_text(
+                '[{"name": "target", "type": "text", "required": false}]'
+            )
+
+            input_dir = temp_path / "input"
+            input_dir.mkdir()
+
+            for i in range(3):
+                input_file = input_dir / f"file{i}.json"
+                input_file.write_text(
+                    json.dumps({"uuid": f"uuid-{i}", "metadata": {"legacy": "old"}})
+                )
+            (input_dir / "broken.json").write_text("{ invalid json }")
+
+            output_dir = temp_path / "output"
+
+            result = self.runner.invoke(
+                main,
+                [
+                    "--field-mapping-file",
+                    str(field_mapping_file),
+                    "--value-mapping-dir",
+                    str(value_mapping_dir),
+                    "--target-schema-file",
+                    str(schema_file),
+                    "--input-dir",
+                    str(input_dir),
+                    "--output-dir",
+                    str(output_dir),
+                    "--workers",
+                    "2",
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert "Files processed: 4" in result.output
+            assert "Successful: 3" in result.output
+            assert "Failed: 1" in result.output
+
+            for i in range(3):
+                with open(output_dir / f"file{i}.json", "r") as f:
+                    output_data = json.load(f)
+                assert output_data["modified_metadata"] == {"target": "new"}
+
+    def test_cli_patch_cache(self) -> None:
+        """Test that --patch-cache writes the cache to the user cache directory."""
+        with TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            field_mapping_file = temp_path / "mapping.json"
+            field_mapping_file.write_text('{"legacy": "target"}')
+
+            value_mapping_dir = temp_path / "value_mappings"
+            value_mapping_dir.mkdir()
+            (value_mapping_dir / "values.json").write_text('{"target": {"old": "new"}}')
+
+            schema_file = temp_path / "schema.json"
+            schema_file.write_text(
+                '[{"name": "target", "type": "text", "required": false}]'
+            )
+
+            patch_dir = temp_path / "patches"
+            patch_dir.mkdir()
+            patch_file = patch_dir / "patches.json"
+            patch_file.write_text('[{"when": {}, "then": {"legacy": "old"}}]')
+
+            input_file = temp_path / "input.json"
+            input_file.write_text(json.dumps({"uuid": "uuid-1", "metadata": {}}))
+
+            cache_home = temp_path / "cache"
+            output_dir = temp_path / "output"
+            args = [
+                "--field-mapping-file",
+                str(field_mapping_file),
+                "--value-mapping-dir",
+                str(value_mapping_dir),
+                "--target-schema-file",
+                str(schema_file),
+                "--patch-file",
+                str(patch_file),
+                "--patch-cache",
+                "--input-file",
+                str(input_file),
+                "--output-dir",
+                str(output_dir),
+            ]
+
+            for _ in range(2):
+                result = self.runner.invoke(
+                    main, args, env={"XDG_CACHE_HOME": str(cache_home)}
+                )
+                assert result.exit_code == 0
+
+                with open(output_dir / "input.json", "r") as f:
+                    output_data = json.load(f)
+                assert output_data["modified_metadata"] == {"target": "new"}
+
+            cache_files = list((cache_home / "json-rules-engine").glob("*.pkl"))
+            assert len(cache_files) == 1
+            assert [p.name for p in patch_dir.iterdir()] == ["patches.json"]
+
     def test_cli_bulk_processing_no_files(self) -> None:
         """Test bulk processing with no JSON files in input directory."""
         with TemporaryDirectory() as temp_dir:
@@ -156,3 +156,38 @@ class TestStructuredProcessingLog:
             "field2": {"True": "Yes"},
         }
         assert log1.excluded_data == {"field_detail": "detail_value"}
+
+    def test_merge_many(self):
+        """Test merging several structured logs matches merging them one by one."""
+        logs = [StructuredProcessingLog() for _ in range(3)]
+        logs[0].add_mapped_field("legacy1", "target1")
+        logs[0].add_unmapped_value("field_a", "value_a", ["opt1", "opt2"])
+        logs[1].add_mapped_field("legacy1", "target2")
+        logs[1].add_mapped_value("True", "Yes", "field2")
+        logs[2].add_unmapped_value("field_b", "value_b", ["opt3", "opt4"])
+        logs[2].add_unmapped_field_with_value("field_detail", "detail_value")
+
+        merged = StructuredProcessingLog()
+        merged.merge_many(iter(logs))
+
+        expected = StructuredProcessingLog()
+        for log in logs:
+            expected.merge_with(log)
+
+        assert merged.to_dict() == expected.to_dict()
+        assert merged.field_mappings == {"legacy1": "target2"}
+        assert [entry.field for entry in merged.ambiguous_mappings] == [
+            "field_a",
+            "field_b",
+        ]
+
+    def test_is_empty(self):
+        """Test empty detection and that merging empty logs is a no-op."""
+        log = StructuredProcessingLog()
+        assert log.is_empty()
+
+        log.merge_many([StructuredProcessingLog(), StructuredProcessingLog()])
+        assert log.is_empty()
+
+        log.add_unmapped_field_with_value("field_detail", "detail_value")
+        assert not log.is_empty()
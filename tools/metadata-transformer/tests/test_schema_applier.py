@@ -9,6 +9,7 @@ from tempfile import TemporaryDirectory
 import pytest
 
 from metadata_transformer.exceptions import SchemaValidationError
+from metadata_transformer.processing_log_provider import ProcessingLogProvider
 from metadata_transformer.schema_applier import Schema
 
 
@@ -138,7 +139,7 @@ class TestSchema:
             # Invalid field definitions are silently skipped during loading
 
     def test_get_schema_fields(self) -> None:
-        """Test getting schema fields returns a copy."""
+        """Test getting schema fields returns a read-only view."""
         loader = Schema()
         original_fields = {"field1": {"type": "text"}}
         loader._schema_fields = original_fields
@@ -146,8 +147,10 @@ class TestSchema:
         retrieved_fields = loader.get_schema_fields()
 
         assert retrieved_fields == original_fields
-        # Should be a copy, not the same object
+        # Should be a view, not the mutable dict itself
         assert retrieved_fields is not loader._schema_fields
+        with pytest.raises(TypeError):
+            retrieved_fields["field2"] = {"type": "text"}  # type: ignore[index]
 
     def test_get_required_fields(self) -> None:
         """Test getting required fields returns a copy."""
@@ -215,3 +218,24 @@ class TestSchema:
 
         # Nonexistent field should be valid
         assert loader.validate_field_value("nonexistent", "any_value") is True
+
+    def test_apply_schema_fills_default_values(self) -> None:
+        """Test applying schema fills missing fields with their defaults."""
+        loader = Schema()
+        loader._parse_schema_fields(
+            [
+                {"name": "present_field", "default_value": "unused"},
+                {"name": "default_field", "default_value": "test_default"},
+                {"name": "null_field"},
+            ]
+        )
+        applier = loader.get_applier(ProcessingLogProvider())
+
+        result = applier.apply_schema({"obsolete_field": 1, "present_field": "value"})
+
+        assert list(result.items()) == [
+            ("present_field", "value"),
+            ("default_field", "test_default"),
+            ("null_field", None),
+        ]
+        assert applier.get_processing_log().excluded_data == {"obsolete_field": 1}
@@ -0,0 +1,56 @@
+"""
+Tests for the serialization module.
+"""
+
+import json
+import math
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from metadata_transformer import serialization
+from metadata_transformer.serialization import load_file, loads
+
+
+class TestSerialization:
+    """Test cases for JSON decoding helpers."""
+
+    def test_loads_object(self) -> None:
+        """Test decoding a JSON object preserves key order and values."""
+        data = loads(b'{"b": 1, "a": [true, null, 1.5], "c": "\\u00e9"}')
+
+        assert data == {"b": 1, "a": [True, None, 1.5], "c": "é"}
+        assert list(data.keys()) == ["b", "a", "c"]
+
+    def test_loads_nan_literal(self) -> None:
+        """Test that NaN literals accepted by the json module still decode."""
+        data = loads(b'{"value": NaN}')
+
+        assert math.isnan(data["value"])
+
+    def test_loads_invalid_json(self) -> None:
+        """Test decoding invalid JSON raises JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{ invalid json }")
+
+    def test_loads_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test decoding falls back to the json module without orjson."""
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert loads(b'{"field": "value"}') == {"field": "value"}
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{ invalid json }")
+
+    def test_load_file(self) -> None:
+        """Test reading and decoding a JSON file."""
+        with TemporaryDirectory() as temp_dir:
+            json_file = Path(temp_dir) / "data.json"
+            json_file.write_text(json.dumps({"field": "välue"}), encoding="utf-8")
+
+            assert load_file(json_file) == {"field": "välue"}
+
+    def test_load_file_nonexistent(self) -> None:
+        """Test reading a non-existent file raises OSError."""
+        with pytest.raises(OSError):
+            load_file(Path("/nonexistent/file.json"))
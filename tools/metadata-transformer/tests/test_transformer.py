@@ -9,6 +9,7 @@ from unittest.mock import Mock
 
 import pytest
 from json_rules_engine import PatchApplier, Patches
+from pyjsonpatch import generate_patch
 
 from metadata_transformer.exceptions import FileProcessingError
 from metadata_transformer.field_mapper import FieldMapper, FieldMappings
@@ -44,6 +45,9 @@ class TestMetadataTransformer:
         self.value_mappings.get_mapper.return_value = self.value_mapper
         self.schema.get_applier.return_value = self.schema_applier
 
+        # No value mappings unless a test configures them
+        self.value_mapper.get_mapped_fields.return_value = set()
+
         # Set up patch_applier to return metadata unchanged by default
         self.patch_applier.apply_patches.side_effect = lambda x: x
 
@@ -136,6 +140,10 @@ class TestMetadataTransformer:
                 ("target_field1", "legacy_value1"): "mapped_value1",
                 ("target_field2", "legacy_value2"): "mapped_value2",
             }.get((f, v), v)
+            self.value_mapper.get_mapped_fields.return_value = {
+                "target_field1",
+                "target_field2",
+            }
 
             self.schema.get_schema_fields.return_value = {
                 "target_field1": {"required": True},
@@ -174,6 +182,32 @@ class TestMetadataTransformer:
             with pytest.raises(FileProcessingError, match="must contain JSON object"):
                 self.transformer.transform_metadata_file(metadata_file)
 
+    def test_transform_many_captures_errors(self) -> None:
+        """Test transforming several files yields results and errors in order."""
+        with TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            valid_file = temp_path / "valid.json"
+            valid_file.write_text(json.dumps({"metadata": {"field": "value"}}))
+            invalid_file = temp_path / "invalid.json"
+            invalid_file.write_text("{ invalid json }")
+
+            self.field_mapper.map_field.side_effect = lambda x: x
+            self.value_mapper.map_value.side_effect = lambda f, v: v
+            self.schema.get_schema_fields.return_value = {"field": {}}
+
+            results = list(
+                self.transformer.transform_many([invalid_file, valid_file], workers=1)
+            )
+
+            assert [input_file for input_file, _, _ in results] == [
+                invalid_file,
+                valid_file,
+            ]
+            assert results[0][1] is None
+            assert isinstance(results[0][2], FileProcessingError)
+            assert results[1][1]["modified_metadata"] == {"field": "value"}
+            assert results[1][2] is None
+
     def test_phase1_field_mapping(self) -> None:
         """Test Phase 1 field mapping functionality."""
         metadata = {
@@ -211,12 +245,15 @@ class TestMetadataTransformer:
             ("field1", "legacy_value1"): "mapped_value1",
             ("field2", "legacy_value2"): "mapped_value2",
         }.get((f, v), v)
+        self.value_mapper.get_mapped_fields.return_value = {"field1", "field2"}
 
         result, log = self.transformer._phase2_value_mapping(metadata)
 
         assert result["field1"] == "mapped_value1"
         assert result["field2"] == "mapped_value2"
         assert result["field3"] == "unmapped_value"  # Original value preserved
+        # Fields without value mappings are not passed to the mapper
+        assert self.value_mapper.map_value.call_count == 2
 
         # Check that log is returned
         assert isinstance(log, StructuredProcessingLog)
@@ -264,6 +301,19 @@ class TestMetadataTransformer:
         assert isinstance(result, dict)
         assert isinstance(combined_log, StructuredProcessingLog)
 
+    def test_transform_metadata_shares_phase_log(self) -> None:
+        """Test all phases of one transformation get the same processing log."""
+        self.schema.get_schema_fields.return_value = {}
+
+        self.transformer._transform_metadata({"field": "value"})
+
+        field_provider = self.field_mappings.get_mapper.call_args[0][0]
+        value_provider = self.value_mappings.get_mapper.call_args[0][0]
+        schema_provider = self.schema.get_applier.call_args[0][0]
+        shared_log = field_provider.create_log()
+        assert value_provider.create_log() is shared_log
+        assert schema_provider.create_log() is shared_log
+
     def test_get_structured_log(self) -> None:
         """Test getting structured processing log."""
         # This test is no longer relevant as structured_log is removed
@@ -331,6 +381,7 @@ class TestMetadataTransformer:
             self.value_mapper.map_value.side_effect = lambda f, v: {
                 ("change_field", "original_value"): "modified_value",
             }.get((f, v), v)
+            self.value_mapper.get_mapped_fields.return_value = {"change_field"}
 
             self.schema.get_schema_fields.return_value = {
                 "new_field": {},
@@ -373,6 +424,7 @@ class TestMetadataTransformer:
             # Simple pass-through mapping
             self.field_mapper.map_field.side_effect = lambda x: x
             self.value_mapper.map_value.side_effect = lambda f, v: f"mapped_{v}"
+            self.value_mapper.get_mapped_fields.return_value = {"field1", "field2"}
 
             self.schema.get_schema_fields.return_value = {
                 "field1": {},
@@ -440,3 +492,27 @@ class TestMetadataTransformer:
             # Should have json_patch key even if empty
             assert "json_patch" in result
             assert isinstance(result["json_patch"], list)
+
+    def test_generate_patch_matches_recursive_diff(self) -> None:
+        """Test json_patch generation matches a full recursive diff."""
+        source = {
+            "removed": "value",
+            "replaced": "old",
+            "equal_number": 1,
+            "nested": {"keep": 1, "change": [1, 2, 3]},
+            "type_changed": [1, 2],
+            "a/b~c": "escaped",
+        }
+        target = {
+            "replaced": "new",
+            "equal_number": 1.0,
+            "nested": {"keep": 1, "change": [1, 5]},
+            "type_changed": "1, 2",
+            "added": {"value": [1]},
+        }
+
+        result = self.transformer._generate_patch(source, target)
+
+        assert self.transformer._sort_patches(result) == (
+            self.transformer._sort_patches(generate_patch(source, target))
+        )
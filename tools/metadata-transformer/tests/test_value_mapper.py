@@ -180,6 +180,31 @@ class TestValueMappings:
             assert mapper.get_all_mappings() == {"field1": {"old": "new"}}
             assert isinstance(mapper.get_processing_log(), StructuredProcessingLog)
 
+    def test_get_mapper_after_reload(self) -> None:
+        """Test mappers see value mappings loaded after an earlier get_mapper."""
+        mappings = ValueMappings()
+
+        with TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "first.json").write_text(json.dumps({"field1": {"a": "b"}}))
+            mappings.load_value_mappings(temp_path)
+            first_mapper = mappings.get_mapper(ProcessingLogProvider())
+
+            (temp_path / "second.json").write_text(json.dumps({"field2": {"c": "d"}}))
+            mappings.load_value_mappings(temp_path)
+            second_mapper = mappings.get_mapper(ProcessingLogProvider())
+
+            assert first_mapper.map_value("field2", "c") == "c"
+            assert second_mapper.map_value("field1", "a") == "b"
+            assert second_mapper.map_value("field2", "c") == "d"
+
+            # All accessors of the earlier mapper agree with its map_value
+            assert not first_mapper.has_mapping_for_field("field2")
+            assert set(first_mapper.get_mapped_fields()) == {"field1"}
+            assert first_mapper.get_field_mappings("field2") == {}
+            assert first_mapper.get_all_mappings() == {"field1": {"a": "b"}}
+            assert second_mapper.has_mapping_for_field("field2")
+
 
 class TestValueMapper:
     """Test cases for ValueMapper class."""
@@ -256,6 +281,17 @@ class TestValueMapper:
         assert mapper.has_mapping_for_field("field2") is True
         assert mapper.has_mapping_for_field("nonexistent") is False
 
+    def test_get_mapped_fields(self) -> None:
+        """Test getting the names of fields with value mappings."""
+        value_mappings = {"field1": {"key": "value"}, "field2": {}}
+        mapper = ValueMapper(value_mappings, ProcessingLogProvider())
+
+        mapped_fields = mapper.get_mapped_fields()
+
+        assert set(mapped_fields) == {"field1", "field2"}
+        assert "field1" in mapped_fields
+        assert "nonexistent" not in mapped_fields
+
     def test_get_field_mappings(self) -> None:
         """Test getting mappings for a specific field."""
         field_mappings = {"key1": "value1", "key2": "value2"}